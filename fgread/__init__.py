@@ -19,4 +19,4 @@ DOCSURL = fgurl + "/docs/"
 DS_URL_PREFIX = fgurl + "/datasets/detail-"
 
 if not within_flit():
-    from .read import ds_info, load_data
+    from .read import ds_info, load_data, clear_load_cache
@@ -1,13 +1,35 @@
-import json
+import copy
+import functools
 import logging
+import os
 import re
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from . import DOCSURL, DS_URL_PREFIX, readers
 
+# use the fastest available JSON decoder, all of them accept bytes
+try:
+    from msgspec.json import Decoder
+
+    json_loads = Decoder().decode
+    del Decoder
+except ImportError:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+try:
+    from IPython.display import display, Markdown
+except ImportError:
+    display = Markdown = None
+
 # configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -27,6 +49,7 @@ DEFAULT_READERS = {
 
 
 DATA_DIR = Path("/fastgenomics/data")
+DS_DIR_RE = re.compile(r"^dataset_\d{4}\Z")
 DF_SORT_ORDER = [
     "title",
     "id",
@@ -44,6 +67,53 @@ DF_SORT_ORDER = [
 ]
 
 
+def get_ds_records(data_dir: Path = DATA_DIR) -> tuple:
+    """Gets the parsed ``dataset_info.json`` of all available datasets.
+    Results are cached as long as no ``dataset_info.json`` in ``data_dir`` changes,
+    so repeated calls in a notebook session do not re-read the files.
+
+    Parameters
+    ----------
+    data_dir : Path, optional
+        Directory containing the datasets, e.g. ``fastgenomics/data``, by default DATA_DIR
+
+    Returns
+    -------
+    tuple
+        A tuple of dicts, one per dataset. The dicts are shared with the cache and must not be modified.
+    """
+    ds_paths = get_ds_paths(data_dir=data_dir)
+    mtime_sig = tuple(
+        (p.name, (p / "dataset_info.json").stat().st_mtime_ns) for p in ds_paths
+    )
+    return _scan_datasets(str(Path(data_dir)), mtime_sig)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_datasets(data_dir: str, mtime_sig: tuple) -> tuple:
+    """Reads all datasets listed in ``mtime_sig``. Cached by :py:func:`get_ds_records`.
+    The files are read concurrently as this is dominated by I/O latency on network mounts.
+    """
+    ds_paths = [Path(data_dir) / name for name, _ in mtime_sig]
+    if len(ds_paths) == 1:
+        # the common case of a single attached dataset does not need a pool
+        return (_read_ds_record(ds_paths[0]),)
+
+    with ThreadPoolExecutor(max_workers=min(32, len(ds_paths))) as ex:
+        return tuple(ex.map(_read_ds_record, ds_paths))
+
+
+def _read_ds_record(ds_path: Path) -> dict:
+    """Reads the ``dataset_info.json`` of a single dataset and adds derived fields."""
+    with open(ds_path / "dataset_info.json", "rb") as f:
+        info = json_loads(f.read())
+    info.pop("schemaVersion", None)
+    info["path"] = str(ds_path)
+    info["numberOfExpressionDataFiles"] = len(info["expressionDataFileInfos"])
+    info["numberOfMetaDataFiles"] = len(info["metaDataFileInfos"])
+    return info
+
+
 def get_datasets_df(data_dir: Path = DATA_DIR) -> pd.DataFrame:
     """Constructs a :py:func:`pandas.DataFrame` from all available datasets.
 
@@ -58,39 +128,39 @@ def get_datasets_df(data_dir: Path = DATA_DIR) -> pd.DataFrame:
         A pandas DataFrame containing all available datasets
     """
 
-    ds_paths = get_ds_paths(data_dir=data_dir)
+    return _records_to_df(get_ds_records(data_dir=data_dir))
 
-    ds_df = pd.DataFrame()
-    for ds_path in ds_paths:
-        with open(ds_path / "dataset_info.json") as f:
-            info_df = json.load(f)
-            info_df["path"] = str(ds_path)
-            info_df["numberOfExpressionDataFiles"] = len(
-                info_df["expressionDataFileInfos"]
-            )
-            info_df["numberOfMetaDataFiles"] = len(info_df["metaDataFileInfos"])
-            _ = info_df.pop("schemaVersion", None)
-        ds_df = ds_df.append(info_df, ignore_index=True)
-
-    # sort colnames
-
-    col_names = ds_df.columns.values.tolist()
-    col_names_sorted = [name for name in DF_SORT_ORDER if name in col_names]
-    [col_names.remove(name) for name in DF_SORT_ORDER if name in col_names]
-    col_names_sorted.extend(col_names)
-    ds_df = ds_df[col_names_sorted]
-
-    # Format types
-    ds_df = ds_df.astype(
-        {
-            "numberOfCells": "int32",
-            "numberOfGenes": "int32",
-            "numberOfExpressionDataFiles": "int32",
-            "numberOfMetaDataFiles": "int32",
-        }
+
+def _records_to_df(records) -> pd.DataFrame:
+    """Builds a DataFrame with sorted columns from parsed ``dataset_info.json`` dicts.
+    The nested file infos are copied, so that edits to the frame do not reach the cached records.
+    """
+    ds_df = pd.DataFrame.from_records(
+        [
+            {
+                **info,
+                "expressionDataFileInfos": copy.deepcopy(
+                    info["expressionDataFileInfos"]
+                ),
+                "metaDataFileInfos": copy.deepcopy(info["metaDataFileInfos"]),
+            }
+            for info in records
+        ]
     )
 
-    return ds_df
+    return _sort_columns(ds_df)
+
+
+def _sort_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Orders the columns of a datasets DataFrame according to ``DF_SORT_ORDER``.
+    Columns not listed there keep their relative order and are appended at the end.
+    """
+    col_names = df.columns.tolist()
+    present = set(col_names)
+    sort_set = set(DF_SORT_ORDER)
+    ordered = [name for name in DF_SORT_ORDER if name in present]
+    ordered += [name for name in col_names if name not in sort_set]
+    return df[ordered]
 
 
 def ds_info(
@@ -115,7 +185,9 @@ def ds_info(
     Returns
     -------
     pd.DataFrame
-        A pandas DataFrame containing all, or a single dataset (depends on ``ds``)
+        A pandas DataFrame containing all, or a single dataset (depends on ``ds``).
+        Count columns keep the integer type of the parsed ``dataset_info.json`` (usually int64),
+        they are only cast to int32 for the pretty output.
     """
 
     if pretty is None:
@@ -130,33 +202,54 @@ def ds_info(
         return
 
     try:
-        ds_df = get_datasets_df(data_dir=data_dir)
+        if ds:
+            # only a single dataset is shown, no need to build the full frame
+            ds_df = _records_to_df([_resolve_single(ds, data_dir=data_dir)])
+        else:
+            ds_df = get_datasets_df(data_dir=data_dir)
     except NoDatasetsError as err:
         logger.warning(err)
         return pd.DataFrame()
 
-    def add_url(title, id):
-        return f'<a href="{DS_URL_PREFIX}{id}" target="_blank">{title}</a>'
+    def add_url(df):
+        return (
+            '<a href="'
+            + DS_URL_PREFIX
+            + df["id"].astype(str)
+            + '" target="_blank">'
+            + df["title"].astype(str)
+            + "</a>"
+        )
+
+    def format_types(df):
+        # cast column by column, DataFrame.astype would copy the whole frame
+        for col in [
+            "numberOfCells",
+            "numberOfGenes",
+            "numberOfExpressionDataFiles",
+            "numberOfMetaDataFiles",
+        ]:
+            if col in df.columns:
+                df[col] = df[col].astype("int32", copy=False)
 
     def disp_pretty_df(df, index=True, header=True):
-        try:
-            from IPython.display import display, Markdown
-
-            df_html = df.to_html(
-                render_links=True,
-                escape=False,
-                header=header,
-                index=index,
-                justify="center",
-            )
-            display(Markdown(df_html))
-        except:
+        if display is None:
             logger.warning(
                 "IPython not available. Pretty printing only works in Jupyter Notebooks."
             )
+            return
+
+        df_html = df.to_html(
+            render_links=True,
+            escape=False,
+            header=header,
+            index=index,
+            justify="center",
+        )
+        display(Markdown(df_html))
 
     if ds:
-        single_ds_df = select_ds_id(ds, df=ds_df)
+        single_ds_df = ds_df
 
         single_ds_df["expressionDataFileNames"] = ", ".join(
             [
@@ -169,46 +262,31 @@ def ds_info(
             [expr["name"] for expr in single_ds_df.loc[0, "metaDataFileInfos"]]
         )
 
-        # Sort columns
-        single_col_names = single_ds_df.columns.values.tolist()
-        single_col_names_sorted = [
-            name for name in DF_SORT_ORDER if name in single_col_names
-        ]
-        [
-            single_col_names.remove(name)
-            for name in DF_SORT_ORDER
-            if name in single_col_names
-        ]
-        single_col_names_sorted.extend(single_col_names)
-        single_ds_df = single_ds_df[single_col_names_sorted]
+        single_ds_df = _sort_columns(single_ds_df)
 
         if pretty:
-            pretty_df = single_ds_df
-
-            pretty_df["expressionDataFileNames"] = "<br>".join(
-                [
-                    expr["name"]
-                    for expr in pretty_df.loc[0, "expressionDataFileInfos"]
-                ]
-            )
-
-            pretty_df["metaDataFileNames"] = ", ".join(
-                [expr["name"] for expr in pretty_df.loc[0, "metaDataFileInfos"]]
-            )
-
             empty_cols = [
-                col for col in pretty_df.columns if pretty_df.loc[0, col] == ""
+                col
+                for col in single_ds_df.columns
+                if single_ds_df.loc[0, col] == ""
             ]
-            pretty_df = pretty_df.drop(
+            # drop returns a new frame, so the returned single_ds_df stays untouched
+            pretty_df = single_ds_df.drop(
                 labels=["expressionDataFileInfos", "metaDataFileInfos"]
                 + empty_cols,
                 axis=1,
                 errors="ignore",
             )
-
-            pretty_df.loc[0, "title"] = pretty_df.apply(
-                lambda x: add_url(x.title, x.id), axis=1
-            ).squeeze()
+            if "expressionDataFileNames" in pretty_df.columns:
+                pretty_df["expressionDataFileNames"] = "<br>".join(
+                    [
+                        expr["name"]
+                        for expr in single_ds_df.loc[0, "expressionDataFileInfos"]
+                    ]
+                )
+
+            format_types(pretty_df)
+            pretty_df["title"] = add_url(pretty_df)
             disp_pretty_df(pretty_df.T, header=False)
 
         if output:
@@ -230,9 +308,8 @@ def ds_info(
                 axis=1,
                 errors="ignore",
             )
-            pretty_df["title"] = pretty_df.apply(
-                lambda x: add_url(x.title, x.id), axis=1
-            )
+            format_types(pretty_df)
+            pretty_df["title"] = add_url(pretty_df)
             disp_pretty_df(pretty_df)
 
         if output:
@@ -242,9 +319,10 @@ def ds_info(
 def load_data(
     ds: Optional[str] = None,
     data_dir: Path = DATA_DIR,
-    additional_readers: dict = {},
+    additional_readers: Optional[dict] = None,
     expression_file: Optional[str] = None,
     as_format: Optional[str] = None,
+    cache: bool = False,
 ):
     """This function loads a single dataset into an AnnData object.
     If there are multiple datasets available you need to specify one by setting
@@ -261,7 +339,7 @@ def load_data(
     additional_readers : dict, optional
         Used to specify your own readers for the specific data set format.
         Dict key needs to be file extension (e.g., h5ad), dict value a function.
-        Still experimental, by default {}
+        Still experimental, by default None
     expression_file: str, Optional
         The name of the expression file to load.
         Only needed when there are multiple expression files in a dataset.
@@ -269,6 +347,10 @@ def load_data(
         Specifies which reader should be uses for this dataset. Overwrites the auto-detection
         of the format. Possible parameters are the file extensions of our supported data
         formats: ``h5ad``, ``h5``, ``hdf5``, ``loom``, ``rds``, ``csv``, ``tsv``.
+    cache: bool, optional
+        Keep the loaded data in memory so that loading the same, unchanged file again
+        returns a copy instead of reading it from disk. The four most recently loaded
+        files are kept. Use :py:func:`clear_load_cache` to free the memory, by default False
 
     Returns
     -------
@@ -288,21 +370,15 @@ def load_data(
     >>> fgread.load_data("my_dataset", additional_readers={"fg": my_loader})
 
     """
-    readers = {**DEFAULT_READERS, **additional_readers}
-
-    if ds:
-        single_df = select_ds_id(ds, df=get_datasets_df(data_dir=data_dir))
+    if additional_readers:
+        readers = ChainMap(additional_readers, DEFAULT_READERS)
     else:
-        single_df = get_datasets_df(data_dir=data_dir)
-        if len(single_df) > 1:
-            raise RuntimeError(
-                "There is more than one dataset available in this analysis. "
-                "Please select one by its ID or title. "
-                'You can list available datasets by using "fgread.ds_info()".'
-            )
+        readers = DEFAULT_READERS
+
+    info = _resolve_single(ds, data_dir=data_dir)
 
-    exp_count = single_df.loc[0, "numberOfExpressionDataFiles"]
-    meta_count = single_df.loc[0, "numberOfMetaDataFiles"]
+    exp_count = info["numberOfExpressionDataFiles"]
+    meta_count = info["numberOfMetaDataFiles"]
 
     if exp_count == 0:
         raise TypeError(
@@ -310,9 +386,7 @@ def load_data(
             f"Metadata files: {meta_count}."
         )
 
-    exp_files = [
-        exp["name"] for exp in single_df.loc[0, "expressionDataFileInfos"]
-    ]
+    exp_files = [exp["name"] for exp in info["expressionDataFileInfos"]]
 
     if expression_file:
         if expression_file in exp_files:
@@ -324,7 +398,7 @@ def load_data(
             )
     else:
         if exp_count == 1:
-            file = single_df.loc[0, "expressionDataFileInfos"][0]["name"]
+            file = exp_files[0]
         else:
             raise TypeError(
                 f"There are {exp_count} expression data files in this dataset. "
@@ -332,11 +406,9 @@ def load_data(
                 f"Available expression files are: {exp_files}."
             )
 
-    title = single_df.loc[0, "title"]
-    ds_id = single_df.loc[0, "id"]
-    path = single_df.loc[0, "path"]
-
-    metadata_dict = single_df.loc[0].to_dict()
+    title = info["title"]
+    ds_id = info["id"]
+    path = info["path"]
 
     if as_format:
         format = as_format.lower()
@@ -349,33 +421,42 @@ def load_data(
                 f'The expression file "{file}" has no valid file suffix.'
             ).with_traceback(e.__traceback__)
 
-    if format in readers:
-        if meta_count != 0:
-            logger.info(
-                f"There are {meta_count} metadata files in this dataset. "
-                "This data will not be integrated into the anndata object."
-            )
-        logger.info(
-            f'Loading file "{file}" from dataset "{title}" in format "{format}" from directory "{path}"...\n'
-        )
-        adata = readers[format](Path(path) / file)
-        adata.uns["ds_metadata"] = {ds_id: {"title": title}}
-        adata.uns["ds_metadata_raw"] = {ds_id: str(metadata_dict)}
-        adata.obs["fg_id"] = ds_id
-        n_genes = adata.shape[1]
-        n_cells = adata.shape[0]
-        logger.info(
-            f'Loaded dataset "{title}" with {n_cells} cells and {n_genes} genes.\n'
-            f"==================================================================\n"
-        )
-        return adata
-    else:
+    reader = readers.get(format)
+    if reader is None:
         raise KeyError(
             f'Unsupported file format "{format}", use one of {list(readers)}. '
             f'You can force the usage of a specific reader by setting "as_format" to a supported format. '
             f"In addition, you can also implement your own reading function. See {DOCSURL} for more information."
         )
 
+    if meta_count != 0:
+        logger.info(
+            f"There are {meta_count} metadata files in this dataset. "
+            "This data will not be integrated into the anndata object."
+        )
+    logger.info(
+        f'Loading file "{file}" from dataset "{title}" in format "{format}" from directory "{path}"...\n'
+    )
+    ds_file = Path(path) / file
+    if cache:
+        # copy, so that changes to the returned object do not leak into the cache
+        adata = _load_cached(reader, str(ds_file), ds_file.stat().st_mtime_ns).copy()
+    else:
+        adata = reader(ds_file)
+    adata.uns["ds_metadata"] = {ds_id: {"title": title}}
+    adata.uns["ds_metadata_raw"] = {ds_id: str(info)}
+    # a single category instead of one string object per cell
+    adata.obs["fg_id"] = pd.Categorical.from_codes(
+        np.zeros(adata.shape[0], dtype=np.int8), categories=[ds_id]
+    )
+    n_genes = adata.shape[1]
+    n_cells = adata.shape[0]
+    logger.info(
+        f'Loaded dataset "{title}" with {n_cells} cells and {n_genes} genes.\n'
+        f"==================================================================\n"
+    )
+    return adata
+
 
 def select_ds_id(ds: str, df: pd.DataFrame = None) -> pd.DataFrame:
     """Select a single dataset from a pandas DataFrame by its ID or title
@@ -392,23 +473,93 @@ def select_ds_id(ds: str, df: pd.DataFrame = None) -> pd.DataFrame:
     pd.DataFrame
         A pandas DataFrame with only the selected dataset.
     """
-    single_df = df.loc[(df["id"] == ds) | (df["title"] == ds)].reset_index(
-        drop=True
-    )
+    mask = (df["id"].to_numpy() == ds) | (df["title"].to_numpy() == ds)
+    # reset_index already returns a new frame, no extra copy needed
+    single_df = df.iloc[mask.nonzero()[0]].reset_index(drop=True)
     len_df = len(single_df)
 
     if len_df == 1:
-        return single_df.copy()
+        return single_df
     elif len_df == 0:
-        add_err = ""
-        if not ds.startswith("dataset-"):
-            add_err = " Please note that dataset titles can be changed by the owner. To be safe, you might want to consider dataset IDs instead."
-        raise KeyError("Your selection matches no datasets." + add_err)
+        raise _no_match_error(ds)
     else:
-        display(single_df)
-        raise KeyError(
-            f"Your selection matches {len_df} datasets. Please make sure to select exactly one."
+        if display is not None:
+            display(single_df)
+        raise _ambiguous_error(len_df)
+
+
+def clear_load_cache():
+    """Removes all datasets kept in memory by :py:func:`load_data` with ``cache=True``."""
+    _load_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(reader, ds_file: str, mtime_ns: int):
+    """Reads ``ds_file`` with ``reader``. Cached by :py:func:`load_data` if requested."""
+    return reader(Path(ds_file))
+
+
+def _resolve_single(ds: Optional[str] = None, data_dir: Path = DATA_DIR) -> dict:
+    """Gets the dataset selected by ``ds``, or the only available dataset if ``ds`` is not set.
+
+    Parameters
+    ----------
+    ds : Optional[str], optional
+        A single dataset ID or dataset title, by default None
+    data_dir : Path, optional
+        Directory containing the datasets, e.g. ``fastgenomics/data``, by default DATA_DIR
+
+    Returns
+    -------
+    dict
+        The parsed ``dataset_info.json`` of the dataset, including its ``path``
+    """
+    if ds:
+        return _find_single_dataset(ds, data_dir=data_dir)
+
+    records = get_ds_records(data_dir=data_dir)
+    if len(records) > 1:
+        raise RuntimeError(
+            "There is more than one dataset available in this analysis. "
+            "Please select one by its ID or title. "
+            'You can list available datasets by using "fgread.ds_info()".'
         )
+    return records[0]
+
+
+def _find_single_dataset(ds: str, data_dir: Path = DATA_DIR) -> dict:
+    """Finds a single dataset by its ID or title in the cached records of :py:func:`get_ds_records`.
+    IDs are unique, so the search stops at the first matching ID. Titles may be shared
+    by several datasets, so a title match is only accepted after all datasets were checked.
+    """
+    title_matches = []
+    for info in get_ds_records(data_dir=data_dir):
+        if info["id"] == ds:
+            return info
+        if info["title"] == ds:
+            title_matches.append(info)
+
+    if len(title_matches) == 1:
+        return title_matches[0]
+    elif not title_matches:
+        raise _no_match_error(ds)
+    else:
+        if display is not None:
+            display(_records_to_df(title_matches))
+        raise _ambiguous_error(len(title_matches))
+
+
+def _no_match_error(ds: str) -> KeyError:
+    add_err = ""
+    if not ds.startswith("dataset-"):
+        add_err = " Please note that dataset titles can be changed by the owner. To be safe, you might want to consider dataset IDs instead."
+    return KeyError("Your selection matches no datasets." + add_err)
+
+
+def _ambiguous_error(n_matches: int) -> KeyError:
+    return KeyError(
+        f"Your selection matches {n_matches} datasets. Please make sure to select exactly one."
+    )
 
 
 def get_ds_paths(data_dir: Union[str, Path] = DATA_DIR) -> list:
@@ -430,11 +581,11 @@ def get_ds_paths(data_dir: Union[str, Path] = DATA_DIR) -> list:
             f'There are no datasets attached to this analysis. Path "{data_dir}" does not exist.'
         )
 
-    paths = [
-        Path(subdir)
-        for subdir in sorted(data_dir.iterdir())
-        if subdir.is_dir() and re.match(r"^dataset_\d{4}$", subdir.name)
-    ]
+    # DirEntry.is_dir() is answered from the directory listing, avoiding a stat per entry
+    with os.scandir(data_dir) as it:
+        entries = [e for e in it if DS_DIR_RE.match(e.name) and e.is_dir()]
+    entries.sort(key=lambda e: e.name)
+    paths = [Path(e.path) for e in entries]
 
     if not paths:
         raise NoDatasetsError(
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -36,3 +37,46 @@ def json_dset(request):
 @pytest.fixture
 def list_datasets():
     return fgread.ds_info(data_dir=DATA_DIR, output=True, pretty=False)
+
+
+@pytest.fixture
+def write_dataset():
+    """Writes a dataset_info.json (and an empty expression file) into ``data_dir / name``."""
+
+    def write(data_dir, name, **info):
+        manifest = {
+            "schemaVersion": "1.0",
+            "title": name,
+            "id": name.replace("_", "-"),
+            "organism": "Homo sapiens",
+            "tissue": "blood",
+            "numberOfCells": 2,
+            "numberOfGenes": 3,
+            "expressionDataFileInfos": [{"name": "expression.h5ad"}],
+            "metaDataFileInfos": [],
+        }
+        manifest.update(info)
+        ds_path = Path(data_dir) / name
+        ds_path.mkdir(exist_ok=True)
+        for expr in manifest["expressionDataFileInfos"]:
+            (ds_path / expr["name"]).touch()
+        with open(ds_path / "dataset_info.json", "w") as f:
+            json.dump(manifest, f)
+        return ds_path
+
+    return write
+
+
+@pytest.fixture
+def synthetic_data_dir(tmp_path, write_dataset):
+    """A data directory with three datasets, two of them sharing the title "Shared title"."""
+    write_dataset(
+        tmp_path,
+        "dataset_0001",
+        title="Unique title",
+        expressionDataFileInfos=[{"name": "a.h5ad"}, {"name": "b.h5ad"}],
+        metaDataFileInfos=[{"name": "meta.csv"}],
+    )
+    write_dataset(tmp_path, "dataset_0002", title="Shared title")
+    write_dataset(tmp_path, "dataset_0003", title="Shared title")
+    return tmp_path
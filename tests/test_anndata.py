@@ -1,5 +1,10 @@
+import os
+
+import anndata
+import numpy as np
 import pytest
 import fgread
+from fgread.read import _scan_datasets
 
 load_fail = {
     "Seurat Object dataset": {"type": NotImplementedError},
@@ -24,5 +29,63 @@ def test_read_anndata(data_dir, dset):
         assert n_genes == dset["numberOfGenes"]
         assert n_cells == dset["numberOfCells"]
         assert adata.uns["ds_metadata"] == {id: {"title": title}}
-        assert adata.uns["ds_metadata_raw"] == {id: str(dset.to_dict())}
+        raw = adata.uns["ds_metadata_raw"][id]
+        assert f"'id': {id!r}" in raw
+        assert f"'title': {title!r}" in raw
+        assert f"'path': {dset['path']!r}" in raw
+        assert "schemaVersion" not in raw
+        n_exp = len(dset["expressionDataFileInfos"])
+        assert f"'numberOfExpressionDataFiles': {n_exp}" in raw
         assert adata.obs["fg_id"][0] == id
+
+def test_load_data_uses_records_cache(synthetic_data_dir):
+    readers = {"h5ad": lambda ds_file: anndata.AnnData(np.zeros((2, 3)))}
+    _scan_datasets.cache_clear()
+    for _ in range(2):
+        fgread.load_data(
+            "dataset-0002", data_dir=synthetic_data_dir, additional_readers=readers
+        )
+    assert _scan_datasets.cache_info().misses == 1
+    assert _scan_datasets.cache_info().hits == 1
+
+
+def test_load_ambiguous_title(synthetic_data_dir):
+    with pytest.raises(KeyError, match="matches 2 datasets"):
+        fgread.load_data("Shared title", data_dir=synthetic_data_dir)
+
+
+
+def test_load_cache(synthetic_data_dir):
+    calls = []
+
+    def counting_reader(ds_file):
+        calls.append(ds_file)
+        return anndata.AnnData(np.zeros((2, 3)))
+
+    def load():
+        return fgread.load_data(
+            "dataset-0002",
+            data_dir=synthetic_data_dir,
+            additional_readers={"h5ad": counting_reader},
+            cache=True,
+        )
+
+    fgread.clear_load_cache()
+    first = load()
+    second = load()
+    assert len(calls) == 1
+    assert first is not second
+    first.uns["modified"] = True
+    assert "modified" not in load().uns
+    assert len(calls) == 1
+
+    fgread.clear_load_cache()
+    load()
+    assert len(calls) == 2
+
+    ds_file = synthetic_data_dir / "dataset_0002" / "expression.h5ad"
+    mtime_ns = ds_file.stat().st_mtime_ns + 10 ** 9
+    os.utime(ds_file, ns=(mtime_ns, mtime_ns))
+    load()
+    assert len(calls) == 3
+    fgread.clear_load_cache()
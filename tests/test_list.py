@@ -1,5 +1,14 @@
 import os
 
+import fgread
+import pytest
+from fgread.read import (
+    _scan_datasets,
+    get_datasets_df,
+    get_ds_records,
+    select_ds_id,
+)
+
 
 # test number of datasets
 def test_list(data_dir, list_datasets):
@@ -14,3 +23,50 @@ def test_representation(json_dset, list_datasets):
     list_data = list_datasets.loc[list_datasets["title"] == title]
     for col in json_data.columns:
         assert list_data[col].values == json_data[col].values
+
+
+# test that parsed datasets are cached until a dataset_info.json changes
+def test_ds_records_cache(synthetic_data_dir, write_dataset):
+    _scan_datasets.cache_clear()
+    first = get_ds_records(synthetic_data_dir)
+    assert get_ds_records(synthetic_data_dir) is first
+    assert _scan_datasets.cache_info().hits == 1
+
+    info_file = write_dataset(
+        synthetic_data_dir, "dataset_0001", title="Renamed"
+    ) / "dataset_info.json"
+    mtime_ns = info_file.stat().st_mtime_ns + 10 ** 9
+    os.utime(info_file, ns=(mtime_ns, mtime_ns))
+    assert get_ds_records(synthetic_data_dir)[0]["title"] == "Renamed"
+
+    write_dataset(synthetic_data_dir, "dataset_0004")
+    records = get_ds_records(synthetic_data_dir)
+    assert [r["id"] for r in records][-1] == "dataset-0004"
+    assert _scan_datasets.cache_info().misses == 3
+
+
+# test that modifying a returned DataFrame does not change later results
+def test_ds_info_not_shared_with_cache(synthetic_data_dir):
+    df = fgread.ds_info(data_dir=synthetic_data_dir, output=True, pretty=False)
+    df.loc[0, "expressionDataFileInfos"].append({"name": "added.h5ad"})
+    df = fgread.ds_info(data_dir=synthetic_data_dir, output=True, pretty=False)
+    assert len(df.loc[0, "expressionDataFileInfos"]) == 2
+
+
+# test that a title shared by several datasets is rejected
+def test_ds_info_ambiguous_title(synthetic_data_dir):
+    with pytest.raises(KeyError, match="matches 2 datasets"):
+        fgread.ds_info("Shared title", data_dir=synthetic_data_dir)
+    df = get_datasets_df(synthetic_data_dir)
+    with pytest.raises(KeyError, match="matches 2 datasets"):
+        select_ds_id("Shared title", df=df)
+
+
+# test that the pretty output does not change the returned DataFrame
+def test_ds_info_pretty_output(synthetic_data_dir):
+    df = fgread.ds_info(
+        "dataset-0001", data_dir=synthetic_data_dir, pretty=True, output=True
+    )
+    assert df.loc[0, "expressionDataFileNames"] == "a.h5ad, b.h5ad"
+    assert df.loc[0, "metaDataFileNames"] == "meta.csv"
+    assert df.loc[0, "title"] == "Unique title"